@@ -1 +1 @@
-from pycketcasts.pocketcasts import PocketCast
\ No newline at end of file
+from pycketcasts.pocketcasts import PocketCast, AuthError
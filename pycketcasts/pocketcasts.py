@@ -1,12 +1,73 @@
-from datetime import datetime
-from typing import List, Union
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time as dt_time, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Union
+from uuid import UUID
+import asyncio
+import io
 import ntpath
 import magic
 import os
+import random
+import re
+import threading
+import time
 
 import requests
-
-endpoints = {
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.util.retry import Retry
+
+import pycketcasts._info as package_info
+
+try:
+    import orjson as _json
+
+    def _dump_json(obj) -> bytes:
+        # Dates go through _json_default like they do with stdlib json, so both encoders agree
+        return _json.dumps(obj, default=_json_default, option=_json.OPT_PASSTHROUGH_DATETIME)
+except ImportError:
+    import json as _json
+
+    def _dump_json(obj) -> bytes:
+        # Compact UTF-8, byte for byte what orjson produces
+        return _json.dumps(obj, default=_json_default, separators=(',', ':'), ensure_ascii=False).encode()
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401 -- lets httpx negotiate HTTP/2
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+endpoints = MappingProxyType({
     'login': 'user/login',
     'list': 'user/podcast/list',
     'new_releases': 'user/new_releases',
@@ -36,11 +97,61 @@ endpoints = {
     'account': 'subscription/status',
     'upload': 'files/upload/request',
     'files': 'files'
+})
+
+
+_CATEGORIES_URL = "https://static.pocketcasts.com/discover/json/categories_v2.json"
+_SHOW_NOTES_URL = "https://podcast-api.pocketcasts.com/episode/show_notes/{}"
+_PODCAST_URL = "https://podcast-api.pocketcasts.com/podcast/full/{}"
+_LIST_URL = "https://lists.pocketcasts.com/{}.json"
+
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+_USER_AGENT = f"{package_info.__title__}/{package_info.__version__}"
+
+# Request bodies that never change, shared instead of rebuilt on every call
+_SUBSCRIPTIONS_BODY = MappingProxyType({'v': 1})
+_UP_NEXT_BODY = MappingProxyType({'version': 2, 'model': 'webplayer'})
+
+# Most episodes sent in a single archive request
+_ARCHIVE_BATCH_SIZE = 500
+
+# List responses larger than this many bytes are parsed incrementally when ijson is installed,
+# as are chunked or compressed responses whose decoded size is not known up front
+_STREAM_PARSE_THRESHOLD = 256 * 1024
+
+# Most podcasts kept by get_podcast_by_id, least recently used are dropped first
+_PODCAST_CACHE_SIZE = 1024
+
+# Marks a podcast ID with no live cache entry, since None is cached for podcasts that were not found
+_MISSING = object()
+
+# Seconds that the optional on-disk cache keeps GET responses, by URL prefix; nothing else is cached
+_CACHE_EXPIRY = {
+    'static.pocketcasts.com': 86400,
+    'lists.pocketcasts.com': 3600,
+    'podcast-api.pocketcasts.com/podcast/full': 3600,
 }
 
+# Fractional seconds in an ISO 8601 timestamp, padded or cut to microseconds before parsing
+_ISO_FRACTION = re.compile(r'\.(\d+)')
 
-def _get_endpoint(name: str) -> str:
-    return endpoints.get(name)
+_ASYNC_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+_ASYNC_MAX_RETRIES = 3
+_ASYNC_BACKOFF_BASE = 0.5
+_ASYNC_BACKOFF_CAP = 30.0
+
+
+def _json_default(value) -> str:
+    if isinstance(value, datetime) and value.tzinfo is None:
+        # Naive datetimes are taken to be UTC
+        return value.replace(tzinfo=timezone.utc).isoformat()
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
 def _make_url(base: str, endpoint: str, suffix: str = "") -> str:
@@ -49,11 +160,78 @@ def _make_url(base: str, endpoint: str, suffix: str = "") -> str:
     return f"{base}/{endpoint}{suffix}"
 
 
+def _parse_iso(date: str) -> Union[datetime, None]:
+    if not date:
+        return None
+    # Before Python 3.11, datetime.fromisoformat rejects a trailing 'Z' and fractions that are not 3 or 6 digits
+    if date[-1] in 'Zz':
+        date = f'{date[:-1]}+00:00'
+    try:
+        if ciso8601 is not None:
+            return ciso8601.parse_datetime(date)
+        return datetime.fromisoformat(_ISO_FRACTION.sub(lambda match: f'.{match.group(1)[:6]:0<6}', date, count=1))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _mime_detector() -> magic.Magic:
+    # Loading the libmagic database is slow, so one detector is shared by every upload
+    return magic.Magic(mime=True)
+
+
+def _to_int(value) -> Union[int, None]:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        # One malformed field should not stop the rest of a list from loading
+        return None
+
+
+class AuthError(Exception):
+    """
+    Raised when PocketCasts does not return an auth token for the given credentials
+    """
+
+
+class _Retry(Retry):
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        # A 5xx to a POST may come after the server acted (e.g. queued an episode), while a 429 was refused outright
+        if method == 'POST' and status_code != 429:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class _AuthState(AuthBase):
+    __slots__ = ('token', 'header', 'prefixes')
+
+    def __init__(self, token: str, prefixes: tuple):
+        self.token = token
+        self.header = {'Authorization': f'Bearer {token}'}
+        self.prefixes = prefixes
+
+    def __call__(self, request):
+        # Only the authenticated endpoints see the token, not the list, static or remote-supplied category hosts
+        if str(request.url).startswith(self.prefixes):
+            request.headers.update(self.header)
+        return request
+
+
 class Episode:
+    __slots__ = ('_data', '_podcast', '_api',
+                 'title', 'id', 'duration', 'url', 'playing', 'size', 'file_type', 'type', 'season', 'number',
+                 'current_position', 'deleted', 'starred', 'podcast_id', 'podcast_title', 'published_date')
+
     def __init__(self, data: dict, podcast, api):
         """
         Interact with a specific podcast episode
 
+        Plain fields (``title``, ``id``, ``duration``, ``url``, ``playing``, ``size``, ``file_type``, ``type``,
+        ``season``, ``number``, ``current_position``, ``deleted``, ``starred``, ``podcast_id``, ``podcast_title``
+        and ``published_date``) are read from the JSON data once and stored as attributes.
+
         :param data: JSON data for episode
         :type data: dict
         :param podcast: Podcast that the episode belongs to
@@ -63,8 +241,22 @@ class Episode:
         """
         self._data = data
         self._podcast = podcast
-        if not self._podcast:
-            self._podcast = api.get_podcast_by_id(podcast_id=self.podcast_id)
+        self.title = data.get('title')
+        self.id = data.get('uuid')
+        self.duration = data.get('duration')
+        self.url = data.get('url')
+        self.playing = (data.get('playing_status') or 0) > 0
+        self.size = data.get('size')
+        self.file_type = data.get('fileType')
+        self.type = data.get('episodeType')
+        self.season = data.get('episodeSeason')
+        self.number = data.get('episodeNumber')
+        self.current_position = data.get('playedUpTo')
+        self.deleted = data.get('isDeleted')
+        self.starred = data.get('starred')
+        self.podcast_id = data.get('podcastUuid') or (podcast.id if podcast else None)
+        self.podcast_title = data.get('podcastTitle')
+        self.published_date = _parse_iso(data.get('published'))
         self._api = api
 
     @property
@@ -75,9 +267,7 @@ class Episode:
         :return: share link
         :rtype: str
         """
-        endpoint = _get_endpoint("share")
-        url = _make_url(base=self._api._api_base,
-                        endpoint=endpoint)
+        url = self._api._urls['share']
         data = self._api._post_json(url=url,
                                     data={'episode': self.id,
                                           'podcast': self.podcast_id})
@@ -97,262 +287,161 @@ class Episode:
         return self._podcast
 
     @property
-    def title(self) -> str:
-        """
-        Get episode title
-
-        :rtype: str
-        """
-        return self._data.get('title')
-
-    @property
-    def id(self) -> str:
+    def show_notes(self) -> str:
         """
-        Get episode ID
+        Get the show notes for the episode
 
+        :return: show notes
         :rtype: str
         """
-        return self._data.get('uuid')
+        url = _SHOW_NOTES_URL.format(self.id)
+        self._api._ensure_token()
+        data = self._api._get_json(url=url)
+        return data.get('show_notes', "")
 
-    @property
-    def duration(self) -> int:
+    def _play_status_body(self, status: int, position: int = None) -> dict:
         """
-        Get episode duration
+        Build the request body for changing this episode's play status
 
-        :rtype: int
+        :param status: Play status (1: unplayed, 2: in progress, 3: played)
+        :type status: int
+        :param position: Playback position in seconds
+        :type position: int
+        :return: request body
+        :rtype: dict
         """
-        return self._data.get('duration')
+        body = {'uuid': self.id, 'podcast': self.podcast_id, 'status': status}
+        if position is not None:
+            body['position'] = position
+        return body
 
-    @property
-    def published_date(self) -> Union[datetime, None]:
+    def _star_body(self, star: bool) -> dict:
         """
-        Get episode's publication date
+        Build the request body for starring or unstarring this episode
 
-        :rtype: datetime.datetime
+        :param star: True to add a star, False to remove it
+        :type star: bool
+        :return: request body
+        :rtype: dict
         """
-        try:
-            return datetime.strptime(self._data.get('published'), 'YYYY-MM-DDTHH:mm:ssZ')
-        except:
-            return None
+        return {'uuid': self.id, 'podcast': self.podcast_id, 'star': star}
 
-    @property
-    def url(self) -> str:
+    def _queue_body(self) -> dict:
         """
-        Get episode url
+        Build the request body for adding this episode to the "Play Next" queue
 
-        :rtype: str
+        :return: request body
+        :rtype: dict
         """
-        return self._data.get('url')
+        return {'version': 2,
+                'episode': {'uuid': self.id,
+                            'title': self.title,
+                            'url': self.url,
+                            'podcast': self.podcast_id,
+                            'published': self._data.get('published')}}
 
-    @property
-    def playing(self) -> bool:
+    def update_progress(self, progress: int) -> bool:
         """
-        Get episode playing status
+        Update progress in this episode
 
+        :param progress: Episode progress in seconds
+        :type progress: int
+        :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        return True if self._data.get('playing_status') > 0 else False
-
-    @property
-    def size(self) -> int:
-        """
-        Get episode size
-
-        :rtype: int
-        """
-        return self._data.get('size')
-
-    @property
-    def file_type(self) -> str:
-        """
-        Get episode file type
-
-        :rtype: str
-        """
-        return self._data.get('fileType')
-
-    @property
-    def type(self) -> str:
-        """
-        Get episode type
-
-        :rtype: str
-        """
-        return self._data.get('episodeType')
-
-    @property
-    def season(self) -> int:
-        """
-        Get episode season
-
-        :rtype: int
-        """
-        return self._data.get('episodeSeason')
-
-    @property
-    def number(self) -> int:
-        """
-        Get episode number
-
-        :rtype: int
-        """
-        return self._data.get('episodeNumber')
-
-    @property
-    def current_position(self) -> int:
-        """
-        Get episode current position
-
-        :rtype: int
-        """
-        return self._data.get('playedUpTo')
+        if progress > self.duration:
+            raise Exception("Cannot update with progress longer than episode duration")
+        url = self._api._urls['play_status']
+        return self._api._post(url=url,
+                               data=self._play_status_body(status=2, position=progress)).ok
 
-    @property
-    def deleted(self) -> bool:
+    def mark_played(self) -> bool:
         """
-        Get whether the episode is deleted
+        Mark this episode as played
 
+        :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        return self._data.get('isDeleted')
+        url = self._api._urls['play_status']
+        return self._api._post(url=url,
+                               data=self._play_status_body(status=3)).ok
 
-    @property
-    def starred(self) -> bool:
+    def mark_unplayed(self) -> bool:
         """
-        Get whether episode is starred
+        Mark this episode as unplayed
 
+        :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        return self._data.get('starred')
-
-    @property
-    def podcast_id(self) -> str:
-        """
-        Get ID of corresponding podcast
-
-        :rtype: str
-        """
-        return self._data.get('podcastUuid') if self._data.get('podcastUuid') else self.podcast.id
-
-    @property
-    def podcast_title(self) -> str:
-        """
-        Get title of corresponding podcast
-
-        :rtype: str
-        """
-        return self._data.get('podcastTitle')
+        url = self._api._urls['play_status']
+        return self._api._post(url=url,
+                               data=self._play_status_body(status=1, position=0)).ok
 
-    @property
-    def show_notes(self) -> str:
+    def add_star(self) -> bool:
         """
-        Get the show notes for the episode
+        Add a star to this episode
 
-        :return: show notes
-        :rtype: str
+        :return: True if successful, False if unsuccessful
+        :rtype: bool
         """
-        url = f"https://podcast-api.pocketcasts.com/episode/show_notes/{self.id}"
-        print(url)
-        data = self._api._get_json(url=url, include_token=True)
-        return data.get('show_notes', "")
+        url = self._api._urls['episode_star']
+        return self._api._post(url=url,
+                               json=self._star_body(star=True)).ok
 
-    def update_progress(self, progress: int) -> bool:
+    def remove_star(self) -> bool:
         """
-        Update progress in this episode
+        Remove a star from this episode
 
-        :param progress: Episode progress in seconds
-        :type progress: int
         :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        if progress > self.duration:
-            raise Exception("Cannot update with progress longer than episode duration")
-        endpoint = _get_endpoint("play_status")
-        url = _make_url(base=self._api._api_base,
-                        endpoint=endpoint)
-        if self._api._post(url=url,
-                           data={'uuid': self.id,
-                                 'podcast': self.podcast_id,
-                                 'status': 2,
-                                 'position': progress
-                                 }
-                           ):
-            return True
-        return False
+        url = self._api._urls['episode_star']
+        return self._api._post(url=url,
+                               json=self._star_body(star=False)).ok
 
-    def mark_played(self) -> bool:
+    async def amark_played(self) -> bool:
         """
-        Mark this episode as played
+        Mark this episode as played without blocking the event loop
 
         :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        endpoint = _get_endpoint("play_status")
-        url = _make_url(base=self._api._api_base,
-                        endpoint=endpoint)
-        if self._api._post(url=url,
-                           data={'uuid': self.id,
-                                 'podcast': self.podcast_id,
-                                 'status': 3
-                                 }
-                           ):
-            return True
-        return False
+        res = await self._api._apost(url=self._api._urls['play_status'],
+                                     data=self._play_status_body(status=3))
+        return res.is_success
 
-    def mark_unplayed(self) -> bool:
+    async def amark_unplayed(self) -> bool:
         """
-        Mark this episode as unplayed
+        Mark this episode as unplayed without blocking the event loop
 
         :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        endpoint = _get_endpoint("play_status")
-        url = _make_url(base=self._api._api_base,
-                        endpoint=endpoint)
-        if self._api._post(url=url,
-                           data={'uuid': self.id,
-                                 'podcast': self.podcast_id,
-                                 'status': 1,
-                                 'position': 0
-                                 }
-                           ):
-            return True
-        return False
+        res = await self._api._apost(url=self._api._urls['play_status'],
+                                     data=self._play_status_body(status=1, position=0))
+        return res.is_success
 
-    def add_star(self) -> bool:
+    async def aadd_star(self) -> bool:
         """
-        Add a star to this episode
+        Add a star to this episode without blocking the event loop
 
         :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        endpoint = _get_endpoint("episode_star")
-        url = _make_url(base=self._api._api_base, endpoint=endpoint)
-        if self._api._post(url=url,
-                           json={"uuid": self.id,
-                                 "podcast": self.podcast_id,
-                                 "star": True}
-                           ):
-            return True
-        return False
+        res = await self._api._apost(url=self._api._urls['episode_star'],
+                                     json=self._star_body(star=True))
+        return res.is_success
 
-    def remove_star(self) -> bool:
+    async def aremove_star(self) -> bool:
         """
-        Remove a star from this episode
+        Remove a star from this episode without blocking the event loop
 
         :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        endpoint = _get_endpoint("episode_star")
-        url = _make_url(base=self._api._api_base,
-                        endpoint=endpoint)
-        if self._api._post(url=url,
-                           json={"uuid": self.id,
-                                 "podcast": self.podcast_id,
-                                 "star": False}
-                           ):
-            return True
-        return False
+        res = await self._api._apost(url=self._api._urls['episode_star'],
+                                     json=self._star_body(star=False))
+        return res.is_success
 
     def archive(self) -> bool:
         """
@@ -361,17 +450,7 @@ class Episode:
         :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        endpoint = _get_endpoint("episode_archive")
-        url = _make_url(base=self._api._api_base, endpoint=endpoint)
-        if self._api._post(url=url,
-                           data={'episodes': [
-                               {'uuid': self.id,
-                                'podcast': self.podcast_id
-                                }
-                           ],
-                               'archive': True}):
-            return True
-        return False
+        return self._api.archive_episodes(episodes=[self], archive=True)
 
     def unarchive(self) -> bool:
         """
@@ -380,18 +459,7 @@ class Episode:
         :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        endpoint = _get_endpoint("episode_archive")
-        url = _make_url(base=self._api._api_base,
-                        endpoint=endpoint)
-        if self._api._post(url=url,
-                           data={'episodes': [
-                               {'uuid': self.id,
-                                'podcast': self.podcast_id
-                                }
-                           ],
-                               'archive': False}):
-            return True
-        return False
+        return self._api.archive_episodes(episodes=[self], archive=False)
 
     def play_next(self) -> bool:
         """
@@ -400,20 +468,7 @@ class Episode:
         :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        endpoint = _get_endpoint("play_next")
-        url = _make_url(base=self._api._api_base, endpoint=endpoint)
-        if self._api._post(url=url,
-                           data={'version': 2,
-                                 'episode': {'uuid': self.id,
-                                             'title': self.title,
-                                             'url': self.url,
-                                             'podcast': self.podcast_id,
-                                             'published': self.published_date
-                                             }
-                                 }
-                           ):
-            return True
-        return False
+        return self._api.enqueue_next(episodes=[self])
 
     def play_last(self) -> bool:
         """
@@ -422,23 +477,15 @@ class Episode:
         :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        endpoint = _get_endpoint("play_last")
-        url = _make_url(base=self._api._api_base, endpoint=endpoint)
-        if self._api._post(url=url,
-                           data={'version': 2,
-                                 'episode': {'uuid': self.id,
-                                             'title': self.title,
-                                             'url': self.url,
-                                             'podcast': self.podcast_id,
-                                             'published': self.published_date
-                                             }
-                                 }
-                           ):
-            return True
-        return False
+        return self._api.enqueue_last(episodes=[self])
 
 
 class Podcast:
+    __slots__ = ('_data', '_api', '_extended_json', '_full_item', '_episodes', '_episodes_fetched_at')
+
+    # Seconds that a fetched episode list is reused before ``episodes`` fetches it again
+    episodes_ttl = 300
+
     def __init__(self, data: dict, api, extended_json: dict = {}, full_item: bool = False):
         """
         Interact with a specific podcast
@@ -452,6 +499,8 @@ class Podcast:
         self._api = api
         self._extended_json = extended_json
         self._full_item = full_item
+        self._episodes = None
+        self._episodes_fetched_at = 0.0
 
     def _get_full_podcast_object(self):
         """
@@ -472,7 +521,7 @@ class Podcast:
         :return: Episode object or None if not found
         :rtype: Episode
         """
-        return self._api.get_episode_by_id(episode_id=episode_id, podcast_id=self.id)
+        return self._api.get_episode_by_id(episode_id=episode_id, podcast_id=self.id, podcast=self)
 
     @property
     def share_link(self) -> Union[str, None]:
@@ -482,9 +531,7 @@ class Podcast:
         :return: share link
         :rtype: str
         """
-        endpoint = _get_endpoint("share")
-        url = _make_url(base=self._api._api_base,
-                        endpoint=endpoint)
+        url = self._api._urls['share']
         data = self._api._post_json(url=url,
                                     data={'episode': "",
                                           'podcast': self.id})
@@ -535,10 +582,7 @@ class Podcast:
 
         :rtype: datetime.datetime
         """
-        date = self._extended_json.get('estimated_next_episode_at')
-        if not date:
-            return None
-        return datetime.strptime(date_string=date, format="YYYY-MM-DDTHH:mm:ssZ")
+        return _parse_iso(self._extended_json.get('estimated_next_episode_at'))
 
     @property
     def has_seasons(self) -> bool:
@@ -621,7 +665,7 @@ class Podcast:
 
         :rtype: bool
         """
-        return False if self._data.get('paid', 0) == 0 else True
+        return (self._data.get('paid') or 0) != 0
 
     @property
     def licensing(self) -> bool:
@@ -630,7 +674,7 @@ class Podcast:
 
         :rtype: bool
         """
-        return False if self._data.get('paid', 0) == 0 else True
+        return (self._data.get('licensing') or 0) != 0
 
     @property
     def feed(self) -> str:
@@ -671,18 +715,73 @@ class Podcast:
     @property
     def episodes(self) -> List[Episode]:
         """
-        Get this podcast's episodes
+        Get this podcast's episodes, reusing the last fetch for ``episodes_ttl`` seconds
 
         :return: List of episodes
         :rtype: list[Episode]
         """
-        endpoint = _get_endpoint("episodes")
-        url = _make_url(base=self._api._api_base,
-                        endpoint=endpoint)
-        data = self._api._post_json(url=url,
-                                    data={'uuid': self.id})
-        return self._api._make_episodes(json_data=data,
-                                        podcast=self)
+        if self._episodes is None or time.monotonic() - self._episodes_fetched_at >= self.episodes_ttl:
+            return self.refresh_episodes()
+        return self._episodes
+
+    def refresh_episodes(self) -> List[Episode]:
+        """
+        Fetch this podcast's episodes, replacing any cached list
+
+        If the fetch fails, the cached list (or an empty one) is returned and is not renewed.
+
+        :return: List of episodes
+        :rtype: list[Episode]
+        """
+        res = self._api._post(url=self._api._urls['episodes'],
+                              data={'uuid': self.id},
+                              stream=True)
+        data = self._api._read_json(res)
+        if not res.ok:
+            return self._episodes or []
+        return self._cache_episodes(data=data)
+
+    def iter_episodes(self) -> Iterator[Episode]:
+        """
+        Fetch this podcast's episodes one at a time, while the response is still downloading (requires ijson)
+
+        Episodes fetched this way are not cached.
+
+        :return: iterator of episodes
+        :rtype: Iterator[Episode]
+        """
+        res = self._api._post(url=self._api._urls['episodes'],
+                              data={'uuid': self.id},
+                              stream=True)
+        for ep in self._api._iter_json_items(res, key='episodes'):
+            yield self._api._make_episode(json_data=ep, podcast=self)
+
+    def _cache_episodes(self, data: dict) -> List[Episode]:
+        """
+        Build and cache this podcast's episodes from JSON data
+
+        :param data: Episodes JSON data
+        :type data: dict
+        :return: List of episodes
+        :rtype: list[Episode]
+        """
+        self._episodes = self._api._make_episodes(json_data=data,
+                                                  podcast=self)
+        self._episodes_fetched_at = time.monotonic()
+        return self._episodes
+
+    async def aepisodes(self) -> List[Episode]:
+        """
+        Get this podcast's episodes without blocking the event loop
+
+        :return: List of episodes
+        :rtype: list[Episode]
+        """
+        res = await self._api._apost(url=self._api._urls['episodes'],
+                                     data={'uuid': self.id})
+        if not res.is_success:
+            return self._episodes or []
+        return self._cache_episodes(data=_json.loads(res.content) if res.content else {})
 
     def subscribe(self) -> bool:
         """
@@ -691,13 +790,9 @@ class Podcast:
         :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        endpoint = _get_endpoint("subscribe")
-        url = _make_url(base=self._api._api_base,
-                        endpoint=endpoint)
-        if self._api._post(url=url,
-                           data={'uuid': self.id}):
-            return True
-        return False
+        url = self._api._urls['subscribe']
+        return self._api._post(url=url,
+                               data={'uuid': self.id}).ok
 
     def unsubscribe(self) -> bool:
         """
@@ -706,16 +801,67 @@ class Podcast:
         :return: True if successful, False if unsuccessful
         :rtype: bool
         """
-        endpoint = _get_endpoint("unsubscribe")
-        url = _make_url(base=self._api._api_base,
-                        endpoint=endpoint)
-        if self._api._post(url=url,
-                           data={'uuid': self.id}):
-            return True
-        return False
+        url = self._api._urls['unsubscribe']
+        return self._api._post(url=url,
+                               data={'uuid': self.id}).ok
+
+    async def asubscribe(self) -> bool:
+        """
+        Subscribe to this podcast without blocking the event loop
+
+        :return: True if successful, False if unsuccessful
+        :rtype: bool
+        """
+        res = await self._api._apost(url=self._api._urls['subscribe'],
+                                     data={'uuid': self.id})
+        return res.is_success
+
+    async def aunsubscribe(self) -> bool:
+        """
+        Unsubscribe to this podcast without blocking the event loop
+
+        :return: True if successful, False if unsuccessful
+        :rtype: bool
+        """
+        res = await self._api._apost(url=self._api._urls['unsubscribe'],
+                                     data={'uuid': self.id})
+        return res.is_success
+
+
+class LazyPodcastList(Sequence):
+    __slots__ = ('_raw', '_podcasts', '_api')
+
+    def __init__(self, raw: list, api):
+        """
+        Read-only list of podcasts that constructs each ``Podcast`` the first time it is read
+
+        :param raw: JSON data for each podcast
+        :type raw: list[dict]
+        :param api: PocketCasts API object
+        :type api: PocketCast
+        """
+        self._raw = raw
+        self._podcasts = [None] * len(raw)
+        self._api = api
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+        podcast = self._podcasts[index]
+        if podcast is None:
+            podcast = self._podcasts[index] = self._api._make_podcast(json_data=self._raw[index])
+        return podcast
+
+    def __repr__(self) -> str:
+        return f"<LazyPodcastList of {len(self._raw)} podcasts>"
 
 
 class Category:
+    __slots__ = ('_data', '_api')
+
     def __init__(self, data: dict, api):
         """
         Interact with a PocketCasts category
@@ -764,12 +910,27 @@ class Category:
         :return: list of podcasts
         :rtype: list[Podcast]
         """
+        return list(self.iter_podcasts(region=region))
+
+    def iter_podcasts(self, region: str = 'us') -> Iterator[Podcast]:
+        """
+        Get podcasts in this category one at a time, while the response is still downloading (requires ijson)
+
+        :param region: Region for the category (default: 'us')
+        :type region: str
+        :return: iterator of podcasts
+        :rtype: Iterator[Podcast]
+        """
         url = self.source.replace('[regionCode]', region)
-        data = self._api._get_json(url=url)
-        return self._api._make_podcasts(json_data=data)
+        res = self._api._get(url=url, stream=True)
+        make_podcast = self._api._make_podcast
+        for pod in self._api._iter_json_items(res, key='podcasts'):
+            yield make_podcast(json_data=pod)
 
 
 class Stats:
+    __slots__ = ('_data',)
+
     def __init__(self, data: dict):
         """
         Interact with your PocketCasts statistics
@@ -831,13 +992,12 @@ class Stats:
 
         :rtype: datetime.datetime
         """
-        date = self._data.get('timesStartedAt')
-        if not date:
-            return None
-        return datetime.strptime(date_string=date, format="YYYY-MM-DDTHH:mm:ssZ")
+        return _parse_iso(self._data.get('timesStartedAt'))
 
 
 class Subscription:
+    __slots__ = ('_data',)
+
     def __init__(self, data: dict):
         """
         Interact with a PocketCasts subscription
@@ -890,10 +1050,7 @@ class Subscription:
 
         :rtype: datetime.datetime
         """
-        date = self._data.get('expiryDate')
-        if not date:
-            return None
-        return datetime.strptime(date_string=date, format="YYYY-MM-DDTHH:mm:ssZ")
+        return _parse_iso(self._data.get('expiryDate'))
 
     @property
     def cancel_url(self) -> str:
@@ -947,7 +1104,7 @@ class Subscription:
 
         :rtype: bool
         """
-        return True if self._data.get('paid') == 1 else False
+        return self._data.get('paid') == 1
 
     @property
     def web_status(self) -> int:
@@ -969,15 +1126,43 @@ class Subscription:
 
 
 class File:
-    def __init__(self, data: dict):
+    __slots__ = ('_data', '_api',
+                 'id', 'title', 'size', 'content_type', 'progress', 'progress_modified', 'duration', 'colour',
+                 'image_url', 'has_custom_image', 'image_status', 'published', 'modified_at')
+
+    def __init__(self, data: dict, api):
+        """
+        Interact with a file uploaded to PocketCasts
+
+        Plain fields (``id``, ``title``, ``size``, ``content_type``, ``progress``, ``progress_modified``,
+        ``duration``, ``colour``, ``image_url``, ``has_custom_image``, ``image_status``, ``published`` and
+        ``modified_at``) are read from the JSON data once and stored as attributes.
+
+        :param data: JSON data for file
+        :type data: dict
+        :param api: PocketCasts API object
+        :type api: PocketCast
+        """
         self._data = data
+        self._api = api
+        self.id = data.get('uuid')
+        self.title = data.get('title')
+        self.size = _to_int(data.get('size'))
+        self.content_type = data.get('contentType')
+        self.progress = _to_int(data.get('playedUpTo'))
+        self.progress_modified = _to_int(data.get('playedUpToModified'))
+        self.duration = _to_int(data.get('duration'))
+        self.colour = _to_int(data.get('colour'))
+        self.image_url = data.get('imageUrl')
+        self.has_custom_image = data.get('hasCustomImage')
+        self.image_status = data.get('imageStatus')
+        self.published = _parse_iso(data.get('published'))
+        self.modified_at = _parse_iso(data.get('modifiedAt'))
 
     def delete(self) -> bool:
-        endpoint = f"{self._api._api_base}/files/{self.id}"
-        res = self._api._delete(url=endpoint)
-        if res:
-            return True
-        return False
+        url = f"{self._api._urls['files']}/{self.id}"
+        res = self._api._delete(url=url)
+        return res.ok
 
     def update(self, name: str = None, colour: int = None) -> bool:
         data = {
@@ -985,14 +1170,10 @@ class File:
             'title': name if name else self.title,
             'colour': colour if colour else self.colour
         }
-        endpoint = _get_endpoint('files')
-        url = _make_url(base=self._api._api_base,
-                        endpoint=endpoint)
+        url = self._api._urls['files']
         res = self._api._post(url=url,
                               data=data)
-        if res:
-            return True
-        return False
+        return res.ok
 
     # TODO Download file
 
@@ -1004,100 +1185,54 @@ class File:
 
     # TODO Mark as unplayed
 
-    @property
-    def id(self) -> str:
-        return self._data.get('uuid')
 
-    @property
-    def title(self) -> str:
-        return self._data.get('title')
+class Account:
+    __slots__ = ('_data', '_api', '_file_details')
 
-    @property
-    def size(self) -> int:
-        return int(self._data.get('size'))
+    def __init__(self, data: dict, api):
+        self._data = data
+        self._api = api
+        self._file_details = None
 
     @property
-    def content_type(self) -> str:
-        return self._data.get('contentType')
+    def subscriptions(self) -> List[Subscription]:
+        """
+        Get your PocketCasts subscriptions
 
-    @property
-    def progress(self) -> int:
-        return int(self._data.get('playedUpTo'))
+        :return: list of PocketCasts subscriptions
+        :rtype: list[Subscription]
+        """
+        return [Subscription(data=sub) for sub in self._data.get('subscriptions') or ()]
 
     @property
-    def progress_modified(self) -> str:
-        return int(self._data.get('playedUpToModified'))
+    def web(self) -> dict:
+        """
+        Get web info
 
-    @property
-    def duration(self) -> int:
-        return int(self._data.get('duration'))
+        :rtype: dict
+        """
+        return self._data.get('web')
 
     @property
-    def published(self) -> Union[datetime, None]:
-        date = self._data.get('published')
-        if not date:
-            return None
-        return datetime.strptime(date_string=date, format="YYYY-MM-DDTHH:mm:ssZ")
+    def _account_file_details(self) -> dict:
+        if self._file_details is None:
+            self._api._ensure_token()
+            res = self._api._get(url=self._api._urls['files'], stream=True)
+            file_details = self._api._read_json(res)
+            if not res.ok:
+                # Not remembered, so the next read tries again
+                return file_details
+            self._file_details = file_details
+        return self._file_details
 
-    @property
-    def colour(self) -> int:
-        return int(self._data.get('colour'))
-
-    @property
-    def image_url(self) -> str:
-        return self._data.get('imageUrl')
-
-    @property
-    def has_custom_image(self) -> bool:
-        return self._data.get('hasCustomImage')
-
-    @property
-    def modified_at(self) -> Union[datetime, None]:
-        date = self._data.get('modifiedAt')
-        if not date:
-            return None
-        return datetime.strptime(date_string=date, format="YYYY-MM-DDTHH:mm:ssZ")
-
-    @property
-    def image_status(self) -> int:
-        return self._data.get('imageStatus')
-
-
-class Account:
-
-    def __init__(self, data: dict, api):
-        self._data = data
-        self._api = api
-
-    @property
-    def subscriptions(self) -> List[Subscription]:
-        """
-        Get your PocketCasts subscriptions
-
-        :return: list of PocketCasts subscriptions
-        :rtype: list[Subscription]
-        """
-        subscriptions = []
-        for sub in self._data.get('subscriptions', []):
-            subscriptions.append(Subscription(data=sub))
-        return subscriptions
-
-    @property
-    def web(self) -> dict:
+    def refresh(self):
         """
-        Get web info
+        Forget the cached file details, so ``files`` and ``account_file_details`` are fetched again on next read
 
-        :rtype: dict
+        :return: None
+        :rtype: None
         """
-        return self._data.get('web')
-
-    @property
-    def _account_file_details(self) -> dict:
-        endpoint = _get_endpoint('files')
-        url = _make_url(base=self._api._api_base,
-                        endpoint=endpoint)
-        res = self._api._get_json(url, include_token=True)
-        return res
+        self._file_details = None
 
     @property
     def account_file_details(self) -> Union[dict, None]:
@@ -1109,10 +1244,7 @@ class Account:
     @property
     def files(self) -> List[File]:
         res = self._account_file_details
-        files = []
-        for file in res.get('files', []):
-            files.append(File(data=file))
-        return files
+        return [File(data=file, api=self._api) for file in res.get('files') or ()]
 
     def upload_file(self, file_path: str) -> bool:
         """
@@ -1125,27 +1257,48 @@ class Account:
         """
         if not os.path.exists(file_path):
             raise Exception("File does not exist.")
-        endpoint = _get_endpoint("upload")
-        url = _make_url(base=self._api._api_base,
-                        endpoint=endpoint)
+        url = self._api._urls['upload']
         file_name = ntpath.basename(file_path)
-        mime_type = magic.Magic(mime=True).from_file(filename=file_path)
+        mime_type = _mime_detector().from_file(filename=file_path)
         file_size = os.path.getsize(file_path)
-        res = self._api._post(url,
-                              data={
-                                  'title': file_name,
-                                  'contentType': 'audio/mpeg',
-                                  'hasCustomImage': False,
-                                  'size': file_size
-                              },
-                              files={file_name: open(file_path, 'rb')})
-        if res:
-            return True
-        return False
+        data = {
+            'title': file_name,
+            'contentType': mime_type,
+            'hasCustomImage': False,
+            'size': file_size
+        }
+        with open(file_path, 'rb') as file:
+            if MultipartEncoder is None:
+                res = self._api._post(url,
+                                      data=data,
+                                      files={file_name: file})
+            else:
+                # Stream the file from disk instead of building the whole multipart body in memory
+                encoder = MultipartEncoder(fields={**{key: str(value) for key, value in data.items()},
+                                                   file_name: (file_name, file)})
+                res = self._api._post(url,
+                                      data=encoder,
+                                      headers={'Content-Type': encoder.content_type})
+        if res.ok:
+            self.refresh()
+        return res.ok
 
 
 class PocketCast:
-    def __init__(self, email: str, password: str):
+    # Seconds that ``featured`` and ``content`` reuse a fetched list, give or take 10% so they do not expire together
+    featured_ttl = 600
+    content_ttl = 300
+    # Seconds that get_podcast_by_id remembers a podcast, and an ID that was not found
+    podcast_ttl = 600
+    podcast_miss_ttl = 60
+
+    def __init__(self,
+                 email: str,
+                 password: str,
+                 max_concurrency: int = 32,
+                 per_host: int = 16,
+                 cache_name: str = None,
+                 timeout: float = 30):
         """
         Interact with the PocketCasts API
 
@@ -1153,14 +1306,107 @@ class PocketCast:
         :type email: str
         :param password: Your PocketCasts password
         :type password: str
+        :param max_concurrency: Maximum number of async requests in flight at once (default: 32)
+        :type max_concurrency: int
+        :param per_host: Maximum number of idle async connections kept alive (default: 16)
+        :type per_host: int
+        :param cache_name: Path of an on-disk cache for categories, lists and podcast details (requires requests-cache).
+            Streamed reads of a cached response must use ``res.content``, never ``res.raw``.
+        :type cache_name: str
+        :param timeout: Seconds to wait for the server to connect or send data before giving up (default: 30)
+        :type timeout: float
         """
         self._api_base = "https://api.pocketcasts.com"
         self._lists_base = "https://lists.pocketcasts.com"
+        self._urls = {name: _make_url(base=self._api_base, endpoint=endpoint)
+                      for name, endpoint in endpoints.items()}
+        self._list_urls = {name: _make_url(base=self._lists_base, endpoint=endpoints[name], suffix=".json")
+                           for name in ('trending', 'popular', 'featured')}
         self._email = email
         self._password = password
-        self._token = None
-        self._session = requests.Session()
-        self._login()
+        self._auth = None
+        self._timeout = timeout
+        self._login_lock = threading.Lock()
+        self._podcast_cache = OrderedDict()
+        self._podcast_cache_lock = threading.Lock()
+        self._list_cache = {}
+        self._account = None
+        self._categories = None
+        self._category_by_name = None
+        self._async_client = None
+        self._async_semaphore = None
+        self._max_concurrency = max_concurrency
+        self._per_host = per_host
+        self._metrics = {'requests_in_flight': 0, 'retries': 0, '429s': 0}
+        if cache_name:
+            if requests_cache is None:
+                raise ImportError("On-disk caching requires requests-cache. "
+                                  "Install with 'pip install pycketcasts[cache]'")
+            self._session = requests_cache.CachedSession(cache_name,
+                                                         backend='sqlite',
+                                                         expire_after=requests_cache.DO_NOT_CACHE,
+                                                         urls_expire_after=_CACHE_EXPIRY,
+                                                         allowable_methods=('GET',))
+        else:
+            self._session = requests.Session()
+        # api., lists., static. and podcast-api. each keep their own pool of keep-alive connections
+        # A read error or timeout may come after the server already acted (e.g. queued an episode), so only
+        # connection errors and error statuses are retried, and POSTs only on 429
+        retries = _Retry(total=5,
+                         read=False,
+                         backoff_factor=0.3,
+                         status_forcelist=[429, 500, 502, 503, 504],
+                         allowed_methods=frozenset(['GET', 'POST', 'DELETE']),
+                         raise_on_status=False)
+        self._session.headers['User-Agent'] = _USER_AGENT
+        self._session.mount("https://", HTTPAdapter(pool_connections=4,
+                                                    pool_maxsize=64,
+                                                    max_retries=retries))
+        # A streamed upload body can only be read once, so a retry would resend the headers with no file
+        self._session.mount(self._urls['upload'], HTTPAdapter(max_retries=0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Close the underlying HTTP session and its pooled connections
+
+        :return: None
+        :rtype: None
+        """
+        self._session.close()
+
+    def cache_clear(self):
+        """
+        Empty the on-disk response cache, if one is in use
+
+        :return: None
+        :rtype: None
+        """
+        if requests_cache is not None and isinstance(self._session, requests_cache.CachedSession):
+            self._session.cache.clear()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Close the HTTP session and, if one was opened, the async HTTP client
+
+        :return: None
+        :rtype: None
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
 
     def _login(self):
         """
@@ -1168,22 +1414,40 @@ class PocketCast:
 
         :return: None
         :rtype: None
+        :raises AuthError: if the login response does not contain a token
         """
-        endpoint = _get_endpoint('login')
-        url = _make_url(base=self._api_base,
-                        endpoint=endpoint)
+        url = self._urls['login']
         json = {'email': self._email,
                 'password': self._password,
                 'scope': 'webplayer'}
-        data = self._post_json(url=url,
-                               json=json)
-        if data:
-            self._token = data['token']
+        res = self._session.post(url=url,
+                                 json=json,
+                                 timeout=self._timeout,
+                                 stream=True)
+        data = self._read_json(res)
+        if not data.get('token'):
+            raise AuthError(f"Could not log in to PocketCasts (HTTP {res.status_code})")
+        self._auth = _AuthState(token=data['token'],
+                                prefixes=(f"{self._api_base}/", _SHOW_NOTES_URL.format('')))
+        self._session.auth = self._auth
+
+    def _ensure_token(self):
+        """
+        Login on first use, so that unauthenticated calls never pay for the login round trip
+
+        :return: None
+        :rtype: None
+        """
+        if self._auth is None:
+            with self._login_lock:
+                if self._auth is None:
+                    self._login()
 
     def _get(self,
              url: str,
              params: dict = None,
-             include_token: bool = False) -> requests.Response:
+             headers: dict = None,
+             stream: bool = False) -> requests.Response:
         """
         Send a GET request to the PocketCasts API
 
@@ -1191,15 +1455,18 @@ class PocketCast:
         :type url: str
         :param params: GET request parameters
         :type params: dict
-        :param include_token: Whether to include the auth token (default: False)
-        :type include_token: bool
+        :param headers: Extra request headers
+        :type headers: dict
+        :param stream: Whether to leave the response body unread on the socket (default: False)
+        :type stream: bool
         :return: API response
         :rtype: requests.Response
         """
         response = self._session.get(url=url,
                                      params=params,
-                                     headers=({'Authorization': f'Bearer {self._token}'}
-                                              if include_token else None))
+                                     headers=headers,
+                                     timeout=self._timeout,
+                                     stream=stream)
         return response
 
     def _post(self,
@@ -1207,7 +1474,9 @@ class PocketCast:
               params: dict = None,
               data: dict = None,
               json: dict = None,
-              files: dict = None) -> requests.Response:
+              files: dict = None,
+              headers: dict = None,
+              stream: bool = False) -> requests.Response:
         """
         Send a POST request to the PocketCasts API
 
@@ -1221,16 +1490,25 @@ class PocketCast:
         :type json: dict
         :param files: Files to send with POST request
         :type files: dict
+        :param headers: Extra request headers
+        :type headers: dict
+        :param stream: Whether to leave the response body unread on the socket (default: False)
+        :type stream: bool
         :return: API response
         :rtype: requests.Response
         """
-        header = {'Authorization': f'Bearer {self._token}'} if self._token else None
+        self._ensure_token()
+        if json is not None:
+            # Serialize with the fast encoder rather than letting requests fall back to stdlib json
+            data, json, headers = _dump_json(json), None, _JSON_HEADERS
         response = self._session.post(url=url,
                                       params=params,
                                       data=data,
                                       json=json,
                                       files=files,
-                                      headers=header)
+                                      headers=headers,
+                                      timeout=self._timeout,
+                                      stream=stream)
         return response
 
     def _delete(self,
@@ -1255,19 +1533,43 @@ class PocketCast:
         :return: API response
         :rtype: requests.Response
         """
-        header = {'Authorization': f'Bearer {self._token}'} if self._token else None
+        self._ensure_token()
         response = self._session.delete(url=url,
                                         params=params,
                                         data=data,
                                         json=json,
                                         files=files,
-                                        headers=header)
+                                        timeout=self._timeout)
         return response
 
+    @staticmethod
+    def _read_json(res: requests.Response) -> dict:
+        """
+        Decode JSON straight from a streamed response, without buffering it into ``res.content`` first
+
+        Responses served by the on-disk cache already hold their body, and are decoded from ``res.content``.
+
+        :param res: Streamed API response
+        :type res: requests.Response
+        :return: JSON data
+        :rtype: dict
+        """
+        try:
+            if not res.ok:
+                return {}
+            if getattr(res, 'from_cache', False) or res._content_consumed:
+                body = res.content
+            else:
+                body = res.raw.read(decode_content=True)
+        finally:
+            res.close()
+        if not body:
+            return {}
+        return _json.loads(body)
+
     def _get_json(self,
                   url: str,
-                  params: dict = None,
-                  include_token: bool = False) -> dict:
+                  params: dict = None) -> dict:
         """
         Get JSON from a GET request to PocketCasts API
 
@@ -1275,17 +1577,13 @@ class PocketCast:
         :type url: str
         :param params: GET request parameters
         :type params: dict
-        :param include_token: Whether to include the auth token (default: False)
-        :type include_token: bool
         :return: JSON data
         :rtype: dict
         """
         res = self._get(url=url,
                         params=params,
-                        include_token=include_token)
-        if res:
-            return res.json()
-        return {}
+                        stream=True)
+        return self._read_json(res)
 
     def _post_json(self,
                    url: str,
@@ -1309,10 +1607,181 @@ class PocketCast:
         res = self._post(url=url,
                          params=params,
                          data=data,
-                         json=json)
-        if res:
-            return res.json()
-        return {}
+                         json=json,
+                         stream=True)
+        return self._read_json(res)
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """
+        Get the async HTTP client, opening it on first use
+
+        :return: async HTTP client
+        :rtype: httpx.AsyncClient
+        """
+        if self._async_client is None:
+            if httpx is None:
+                raise ImportError("Async support requires httpx. Install with 'pip install pycketcasts[async]'")
+            # Over HTTP/2, concurrent requests to a host are multiplexed on one connection
+            self._async_client = httpx.AsyncClient(http2=_HTTP2,
+                                                   headers={'User-Agent': _USER_AGENT},
+                                                   timeout=self._timeout,
+                                                   limits=httpx.Limits(max_connections=self._max_concurrency,
+                                                                       max_keepalive_connections=self._per_host,
+                                                                       keepalive_expiry=75))
+            self._async_semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._async_client
+
+    @property
+    def metrics(self) -> dict:
+        """
+        Get counters for the async client (requests in flight, retries and rate-limited responses)
+
+        :rtype: dict
+        """
+        return dict(self._metrics)
+
+    @staticmethod
+    def _retry_delay(res: "httpx.Response", attempt: int) -> float:
+        """
+        Get how long to wait before retrying a throttled or failed async request
+
+        :param res: API response that triggered the retry
+        :type res: httpx.Response
+        :param attempt: Number of attempts made so far, starting at 0
+        :type attempt: int
+        :return: delay in seconds
+        :rtype: float
+        """
+        retry_after = res.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return min(_ASYNC_BACKOFF_CAP, float(retry_after))
+        backoff = min(_ASYNC_BACKOFF_CAP, _ASYNC_BACKOFF_BASE * 2 ** attempt)
+        return backoff + random.uniform(0, _ASYNC_BACKOFF_BASE)
+
+    async def _arequest(self, method: str, url: str, **kwargs) -> "httpx.Response":
+        """
+        Send an async request, bounded by ``max_concurrency`` and retried with backoff on 429/5xx
+
+        :param method: HTTP method
+        :type method: str
+        :param url: API endpoint
+        :type url: str
+        :return: API response
+        :rtype: httpx.Response
+        """
+        client = self._get_async_client()
+        async with self._async_semaphore:
+            attempt = 0
+            while True:
+                self._metrics['requests_in_flight'] += 1
+                try:
+                    res = await client.request(method, url, **kwargs)
+                finally:
+                    self._metrics['requests_in_flight'] -= 1
+                if res.status_code not in _ASYNC_RETRY_STATUSES or attempt >= _ASYNC_MAX_RETRIES:
+                    return res
+                if res.status_code == 429:
+                    self._metrics['429s'] += 1
+                self._metrics['retries'] += 1
+                await asyncio.sleep(self._retry_delay(res=res, attempt=attempt))
+                attempt += 1
+
+    async def _aensure_token(self):
+        """
+        Login on first use without blocking the event loop, and authorize the async HTTP client
+
+        :return: None
+        :rtype: None
+        """
+        if self._auth is None:
+            await asyncio.get_running_loop().run_in_executor(None, self._ensure_token)
+        # Shares the sync session's scoped auth, so other hosts never see the token
+        self._get_async_client().auth = self._auth
+
+    async def _aget(self,
+                    url: str,
+                    params: dict = None) -> "httpx.Response":
+        """
+        Send an async GET request to the PocketCasts API
+
+        :param url: API endpoint
+        :type url: str
+        :param params: GET request parameters
+        :type params: dict
+        :return: API response
+        :rtype: httpx.Response
+        """
+        return await self._arequest('GET', url, params=params)
+
+    async def _apost(self,
+                     url: str,
+                     params: dict = None,
+                     data: dict = None,
+                     json: dict = None) -> "httpx.Response":
+        """
+        Send an async POST request to the PocketCasts API
+
+        :param url: API endpoint
+        :type url: str
+        :param params: POST request parameters
+        :type params: dict
+        :param data: POST request body
+        :type data: dict
+        :param json: POST request JSON body
+        :type json: dict
+        :return: API response
+        :rtype: httpx.Response
+        """
+        await self._aensure_token()
+        if json is not None:
+            return await self._arequest('POST', url, params=params, content=_dump_json(json), headers=_JSON_HEADERS)
+        return await self._arequest('POST', url, params=params, data=data)
+
+    async def _aget_json(self,
+                         url: str,
+                         params: dict = None) -> dict:
+        """
+        Get JSON from an async GET request to PocketCasts API
+
+        :param url: API endpoint
+        :type url: str
+        :param params: GET request parameters
+        :type params: dict
+        :return: JSON data
+        :rtype: dict
+        """
+        res = await self._aget(url=url,
+                               params=params)
+        if not res.is_success or not res.content:
+            return {}
+        return _json.loads(res.content)
+
+    async def _apost_json(self,
+                          url: str,
+                          params: dict = None,
+                          data: dict = None,
+                          json: dict = None) -> dict:
+        """
+        Get JSON from an async POST request to PocketCasts API
+
+        :param url: API endpoint
+        :type url: str
+        :param params: POST request parameters
+        :type params: dict
+        :param data: POST request body
+        :type data: dict
+        :param json: POST request JSON body
+        :type json: dict
+        :return: JSON data
+        :rtype: dict
+        """
+        res = await self._apost(url=url,
+                                params=params,
+                                data=data,
+                                json=json)
+        if not res.is_success or not res.content:
+            return {}
+        return _json.loads(res.content)
 
     def _make_podcast(self,
                       json_data: dict) -> Podcast:
@@ -1338,11 +1807,12 @@ class PocketCast:
         :return: list of Podcast objects
         :rtype: list[Podcast]
         """
-        podcasts = []
-        if json_data and json_data.get('podcasts'):
-            for pod in json_data['podcasts']:
-                podcasts.append(self._make_podcast(json_data=pod))
-        return podcasts
+        podcasts = json_data.get('podcasts') if json_data else None
+        if podcasts:
+            # Entries may arrive in the extended {'podcast': ...} form, which _make_podcast unwraps
+            make_podcast = self._make_podcast
+            return [make_podcast(json_data=pod) for pod in podcasts]
+        return []
 
     def _make_episode(self,
                       json_data: dict,
@@ -1370,11 +1840,11 @@ class PocketCast:
         :return: list of Episode objects
         :rtype: list[Episode]
         """
-        episodes = []
-        if json_data and json_data.get('episodes'):
-            for ep in json_data['episodes']:
-                episodes.append(self._make_episode(json_data=ep, podcast=podcast))
-        return episodes
+        episodes = json_data.get('episodes') if json_data else None
+        if episodes:
+            make_episode = self._make_episode
+            return [make_episode(json_data=ep, podcast=podcast) for ep in episodes]
+        return []
 
     def _make_category(self, json_data: dict) -> Category:
         """
@@ -1396,27 +1866,129 @@ class PocketCast:
         :return: list of Category objects
         :rtype: list[Category]
         """
-        categories = []
         if json_data:
-            for cat in json_data:
-                categories.append(self._make_category(json_data=json_data))
-        return categories
+            return [self._make_category(json_data=cat) for cat in json_data]
+        return []
+
+    def _fetch_episodes(self, name: str, data: dict = None) -> List[Episode]:
+        """
+        Get the episodes returned by a named API endpoint
+
+        :param name: Name of endpoint
+        :type name: str
+        :param data: POST request body
+        :type data: dict
+        :return: list of episodes
+        :rtype: list[Episode]
+        """
+        data = self._post_json(url=self._urls[name],
+                               data=data)
+        return self._make_episodes(json_data=data)
+
+    def _iter_json_items(self, res: requests.Response, key: str) -> Iterator[dict]:
+        """
+        Decode the items of a top-level JSON array one at a time while a streamed response is still being read
+
+        Without ijson installed, the whole response is decoded first.
+
+        :param res: Streamed API response
+        :type res: requests.Response
+        :param key: Name of the array (i.e. 'podcasts')
+        :type key: str
+        :return: iterator of item JSON data
+        :rtype: Iterator[dict]
+        """
+        if ijson is None:
+            yield from self._read_json(res).get(key) or []
+            return
+        try:
+            if not res.ok:
+                return
+            if getattr(res, 'from_cache', False) or res._content_consumed:
+                # A cached (or already read) body is in memory, and its raw stream cannot be read again
+                yield from ijson.items(io.BytesIO(res.content), f'{key}.item', use_float=True)
+                return
+            res.raw.decode_content = True
+            yield from ijson.items(res.raw, f'{key}.item', use_float=True)
+        finally:
+            res.close()
+
+    def _read_json_items(self, res: requests.Response, key: str) -> List[dict]:
+        """
+        Decode a top-level JSON array from a streamed response, incrementally if the response is large or of unknown size
+
+        A response from the on-disk cache is already in memory, so it is decoded in one go.
+
+        :param res: Streamed API response
+        :type res: requests.Response
+        :param key: Name of the array (i.e. 'podcasts')
+        :type key: str
+        :return: list of item JSON data
+        :rtype: list[dict]
+        """
+        if ijson is not None and not getattr(res, 'from_cache', False):
+            length = res.headers.get('Content-Length')
+            # Without a length (chunked), or with only the compressed length, assume the body is large
+            if length is None or 'Content-Encoding' in res.headers or int(length) > _STREAM_PARSE_THRESHOLD:
+                return list(self._iter_json_items(res, key=key))
+        return self._read_json(res).get(key) or []
+
+    def _get_list(self, url: str, ttl: float) -> LazyPodcastList:
+        """
+        Get the podcasts in a PocketCasts list, reusing a recent fetch of the same list
+
+        Once ``ttl`` has passed, the list is revalidated with its ETag or Last-Modified date,
+        and a "304 Not Modified" response keeps the podcasts already built. If the fetch fails,
+        the last list fetched (or an empty one) is returned without being cached.
+
+        :param url: List URL
+        :type url: str
+        :param ttl: Seconds to reuse the fetched list for
+        :type ttl: float
+        :return: list of podcasts, each constructed when first read
+        :rtype: LazyPodcastList
+        """
+        now = time.monotonic()
+        expires = now + ttl * random.uniform(0.9, 1.1)
+        cached = self._list_cache.get(url)
+        if cached and cached[0] > now:
+            return cached[1]
+        res = self._get(url=url, headers=cached[2] if cached else None, stream=True)
+        if res.status_code == 304:
+            res.close()
+            self._list_cache[url] = (expires, cached[1], cached[2])
+            return cached[1]
+        if not res.ok:
+            res.close()
+            # Failures are not remembered, so the next read tries again
+            return cached[1] if cached else LazyPodcastList(raw=[], api=self)
+        validators = {}
+        if res.headers.get('ETag'):
+            validators['If-None-Match'] = res.headers['ETag']
+        if res.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = res.headers['Last-Modified']
+        podcasts = LazyPodcastList(raw=self._read_json_items(res, key='podcasts'), api=self)
+        self._list_cache[url] = (expires, podcasts, validators)
+        return podcasts
 
     @property
     def account(self) -> Account:
         """
-        Get your PocketCasts user account
+        Get your PocketCasts user account, fetched once per client
 
         :return: PocketCasts user account
         :rtype: Account
         """
-        endpoint = _get_endpoint("account")
-        url = _make_url(base=self._api_base,
-                        endpoint=endpoint)
-        data = self._get_json(url=url,
-                              include_token=True)
-        return Account(data=data,
-                       api=self)
+        if self._account is None:
+            self._ensure_token()
+            res = self._get(url=self._urls['account'], stream=True)
+            account = Account(data=self._read_json(res),
+                              api=self)
+            if not res.ok:
+                # Not remembered, so the next read tries again
+                return account
+            self._account = account
+        return self._account
 
     @property
     def stats(self) -> Union[Stats, None]:
@@ -1426,9 +1998,7 @@ class PocketCast:
         :return: dictionary of statistics
         :rtype: dict
         """
-        endpoint = _get_endpoint("stats")
-        url = _make_url(base=self._api_base,
-                        endpoint=endpoint)
+        url = self._urls['stats']
         data = self._post_json(url=url)
         if data:
             return Stats(data=data)
@@ -1442,12 +2012,11 @@ class PocketCast:
         :return: list of podcasts
         :rtype: list[Podcast]
         """
-        endpoint = _get_endpoint("list")
-        url = _make_url(base=self._api_base,
-                        endpoint=endpoint)
-        data = self._post_json(url=url,
-                               data={'v': 1})
-        return self._make_podcasts(json_data=data)
+        res = self._post(url=self._urls['list'],
+                         data=_SUBSCRIPTIONS_BODY,
+                         stream=True)
+        make_podcast = self._make_podcast
+        return [make_podcast(json_data=pod) for pod in self._read_json_items(res, key='podcasts')]
 
     @property
     def in_progress(self) -> List[Episode]:
@@ -1457,11 +2026,7 @@ class PocketCast:
         :return: list of episodes
         :rtype: list[Episode]
         """
-        endpoint = _get_endpoint("in_progress")
-        url = _make_url(base=self._api_base,
-                        endpoint=endpoint)
-        data = self._post_json(url=url)
-        return self._make_episodes(json_data=data)
+        return self._fetch_episodes(name='in_progress')
 
     @property
     def up_next(self) -> List[Episode]:
@@ -1471,14 +2036,8 @@ class PocketCast:
         :return: list of episodes
         :rtype: list[Episode]
         """
-        endpoint = _get_endpoint("up_next")
-        url = _make_url(base=self._api_base,
-                        endpoint=endpoint)
-        data = self._post_json(url=url,
-                               data={'version': 2,
-                                     'model': 'webplayer'})
-        return self._make_episodes(json_data=data,
-                                   podcast=None)
+        return self._fetch_episodes(name='up_next',
+                                    data=_UP_NEXT_BODY)
 
     @property
     def starred(self) -> List[Episode]:
@@ -1488,11 +2047,7 @@ class PocketCast:
         :return: list of episodes
         :rtype: list[Episode]
         """
-        endpoint = _get_endpoint("starred")
-        url = _make_url(base=self._api_base,
-                        endpoint=endpoint)
-        data = self._post_json(url=url)
-        return self._make_episodes(json_data=data)
+        return self._fetch_episodes(name='starred')
 
     @property
     def history(self) -> List[Episode]:
@@ -1502,11 +2057,7 @@ class PocketCast:
         :return: list of episodes
         :rtype: list[Episode]
         """
-        endpoint = _get_endpoint("history")
-        url = _make_url(base=self._api_base,
-                        endpoint=endpoint)
-        data = self._post_json(url=url)
-        return self._make_episodes(json_data=data)
+        return self._fetch_episodes(name='history')
 
     @property
     def new_releases(self) -> List[Episode]:
@@ -1516,11 +2067,7 @@ class PocketCast:
         :return: list of episodes
         :rtype: list[Episode]
         """
-        endpoint = _get_endpoint("new_releases")
-        url = _make_url(base=self._api_base,
-                        endpoint=endpoint)
-        data = self._post_json(url=url)
-        return self._make_episodes(json_data=data)
+        return self._fetch_episodes(name='new_releases')
 
     @property
     def recommendations(self) -> List[Episode]:
@@ -1530,12 +2077,250 @@ class PocketCast:
         :return: list of episodes
         :rtype: list[Episode]
         """
-        endpoint = _get_endpoint("recommendations")
-        url = _make_url(base=self._api_base,
-                        endpoint=endpoint)
-        data = self._post_json(url=url)
+        return self._fetch_episodes(name='recommendations')
+
+    async def _afetch_episodes(self, name: str, data: dict = None) -> List[Episode]:
+        """
+        Get the episodes returned by a named API endpoint without blocking the event loop
+
+        :param name: Name of endpoint
+        :type name: str
+        :param data: POST request body
+        :type data: dict
+        :return: list of episodes
+        :rtype: list[Episode]
+        """
+        data = await self._apost_json(url=self._urls[name],
+                                      data=data)
         return self._make_episodes(json_data=data)
 
+    async def asubscriptions(self) -> List[Podcast]:
+        """
+        Get your PocketCasts podcast subscriptions without blocking the event loop
+
+        :return: list of podcasts
+        :rtype: list[Podcast]
+        """
+        data = await self._apost_json(url=self._urls['list'],
+                                      data=_SUBSCRIPTIONS_BODY)
+        return self._make_podcasts(json_data=data)
+
+    async def ain_progress(self) -> List[Episode]:
+        """
+        Get your in-progress podcast episodes without blocking the event loop
+
+        :return: list of episodes
+        :rtype: list[Episode]
+        """
+        return await self._afetch_episodes(name='in_progress')
+
+    async def aup_next(self) -> List[Episode]:
+        """
+        Get the podcast episodes in your queue without blocking the event loop
+
+        :return: list of episodes
+        :rtype: list[Episode]
+        """
+        return await self._afetch_episodes(name='up_next',
+                                           data=_UP_NEXT_BODY)
+
+    async def astarred(self) -> List[Episode]:
+        """
+        Get your starred podcast episodes without blocking the event loop
+
+        :return: list of episodes
+        :rtype: list[Episode]
+        """
+        return await self._afetch_episodes(name='starred')
+
+    async def ahistory(self) -> List[Episode]:
+        """
+        Get your podcast episode history without blocking the event loop
+
+        :return: list of episodes
+        :rtype: list[Episode]
+        """
+        return await self._afetch_episodes(name='history')
+
+    async def anew_releases(self) -> List[Episode]:
+        """
+        Get newly-released podcast episodes without blocking the event loop
+
+        :return: list of episodes
+        :rtype: list[Episode]
+        """
+        return await self._afetch_episodes(name='new_releases')
+
+    async def arecommendations(self) -> List[Episode]:
+        """
+        Get recommended podcast episodes without blocking the event loop
+
+        :return: list of episodes
+        :rtype: list[Episode]
+        """
+        return await self._afetch_episodes(name='recommendations')
+
+    async def batch(self, *coros) -> list:
+        """
+        Run several async calls concurrently, i.e. ``await api.batch(*[ep.amark_played() for ep in episodes])``
+
+        Requests are still bounded by ``max_concurrency``.
+
+        :param coros: coroutines to run
+        :return: results of each coroutine, in the order given
+        :rtype: list
+        """
+        return list(await asyncio.gather(*coros))
+
+    async def aepisodes_for(self, podcasts: List[Podcast]) -> List[List[Episode]]:
+        """
+        Get the episodes of several podcasts concurrently
+
+        :param podcasts: podcasts to get episodes for
+        :type podcasts: list[Podcast]
+        :return: list of episodes for each podcast, in the same order as ``podcasts``
+        :rtype: list[list[Episode]]
+        """
+        return list(await asyncio.gather(*[podcast.aepisodes() for podcast in podcasts]))
+
+    def archive_episodes(self, episodes: List[Episode], archive: bool = True) -> bool:
+        """
+        Archive or unarchive several episodes, sending up to 500 episodes per request
+
+        :param episodes: episodes to archive or unarchive
+        :type episodes: list[Episode]
+        :param archive: True to archive, False to unarchive (default: True)
+        :type archive: bool
+        :return: True if successful, False if any request was unsuccessful
+        :rtype: bool
+        """
+        url = self._urls['episode_archive']
+        success = True
+        for start in range(0, len(episodes), _ARCHIVE_BATCH_SIZE):
+            batch = episodes[start:start + _ARCHIVE_BATCH_SIZE]
+            if not self._post(url=url,
+                              json={'episodes': [{'uuid': episode.id,
+                                                  'podcast': episode.podcast_id}
+                                                 for episode in batch],
+                                    'archive': archive}).ok:
+                success = False
+        return success
+
+    def star_episodes(self, episodes: List[Episode], star: bool = True, concurrency: int = 16) -> bool:
+        """
+        Add or remove a star on several episodes concurrently
+
+        The star endpoint takes a single episode, so one request is sent per episode.
+
+        :param episodes: episodes to star or unstar
+        :type episodes: list[Episode]
+        :param star: True to add a star, False to remove it (default: True)
+        :type star: bool
+        :param concurrency: maximum number of concurrent requests (default: 16)
+        :type concurrency: int
+        :return: True if successful, False if any request was unsuccessful
+        :rtype: bool
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return all(executor.map(lambda episode: episode.add_star() if star else episode.remove_star(),
+                                    episodes))
+
+    def mark_episodes_played(self, episodes: List[Episode], played: bool = True, concurrency: int = 16) -> bool:
+        """
+        Mark several episodes as played or unplayed concurrently
+
+        The play status endpoint takes a single episode, so one request is sent per episode.
+
+        :param episodes: episodes to mark
+        :type episodes: list[Episode]
+        :param played: True to mark as played, False to mark as unplayed (default: True)
+        :type played: bool
+        :param concurrency: maximum number of concurrent requests (default: 16)
+        :type concurrency: int
+        :return: True if successful, False if any request was unsuccessful
+        :rtype: bool
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return all(executor.map(lambda episode: episode.mark_played() if played else episode.mark_unplayed(),
+                                    episodes))
+
+    def _enqueue(self, name: str, episodes: List[Episode]) -> bool:
+        """
+        Add episodes to the "Play Next" queue one at a time, in the given order
+
+        :param name: Name of endpoint (either 'play_next' or 'play_last')
+        :type name: str
+        :param episodes: episodes to add
+        :type episodes: list[Episode]
+        :return: True if successful, False if any request was unsuccessful
+        :rtype: bool
+        """
+        url = self._urls[name]
+        success = True
+        for episode in episodes:
+            if not self._post(url=url, json=episode._queue_body()).ok:
+                success = False
+        return success
+
+    def enqueue_next(self, episodes: List[Episode]) -> bool:
+        """
+        Add several episodes to the front of the "Play Next" queue, keeping their order
+
+        The queue endpoint takes a single episode, so one request is sent per episode over the same connection.
+        Requests are not sent concurrently, since the server orders the queue by arrival.
+
+        :param episodes: episodes to add, in the order they should play
+        :type episodes: list[Episode]
+        :return: True if successful, False if any request was unsuccessful
+        :rtype: bool
+        """
+        # Each episode is pushed to the front, so push the last one first
+        return self._enqueue(name='play_next', episodes=list(reversed(episodes)))
+
+    def enqueue_last(self, episodes: List[Episode]) -> bool:
+        """
+        Add several episodes to the end of the "Play Next" queue, keeping their order
+
+        The queue endpoint takes a single episode, so one request is sent per episode over the same connection.
+        Requests are not sent concurrently, since the server orders the queue by arrival.
+
+        :param episodes: episodes to add, in the order they should play
+        :type episodes: list[Episode]
+        :return: True if successful, False if any request was unsuccessful
+        :rtype: bool
+        """
+        return self._enqueue(name='play_last', episodes=episodes)
+
+    def episodes_for(self, podcasts: List[Podcast], concurrency: int = 16) -> Dict[str, List[Episode]]:
+        """
+        Get the episodes of several podcasts concurrently
+
+        :param podcasts: podcasts to get episodes for
+        :type podcasts: list[Podcast]
+        :param concurrency: maximum number of concurrent requests (default: 16)
+        :type concurrency: int
+        :return: dictionary of podcast ID to list of episodes
+        :rtype: dict[str, list[Episode]]
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            episodes = executor.map(lambda podcast: podcast.episodes, podcasts)
+            return {podcast.id: podcast_episodes for podcast, podcast_episodes in zip(podcasts, episodes)}
+
+    def fetch_many(self, names: List[str], max_workers: int = 8) -> dict:
+        """
+        Fetch several independent properties concurrently
+
+        :param names: names of properties to fetch (i.e. ['subscriptions', 'starred', 'history'])
+        :type names: list[str]
+        :param max_workers: maximum number of concurrent requests (default: 8)
+        :type max_workers: int
+        :return: dictionary of property name to its value
+        :rtype: dict
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(getattr, self, name) for name in names}
+        return {name: future.result() for name, future in futures.items()}
+
     def _get_podcast_data_by_id(self, podcast_id: str) -> dict:
         """
         Get a podcast's data by its ID
@@ -1545,23 +2330,154 @@ class PocketCast:
         :return: JSON data
         :rtype: dict
         """
-        url = f"https://podcast-api.pocketcasts.com/podcast/full/{podcast_id}"
+        url = _PODCAST_URL.format(podcast_id)
         data = self._get_json(url=url)
         return data
 
+    def _cached_podcast(self, podcast_id: str) -> Union[Podcast, None, object]:
+        """
+        Get a previous lookup's result from the podcast cache
+
+        :param podcast_id: ID of podcast
+        :type podcast_id: str
+        :return: Podcast, None if the podcast was not found, or ``_MISSING`` if not cached or expired
+        :rtype: Podcast
+        """
+        with self._podcast_cache_lock:
+            entry = self._podcast_cache.get(podcast_id)
+            if entry is None:
+                return _MISSING
+            expires, podcast = entry
+            if expires <= time.monotonic():
+                del self._podcast_cache[podcast_id]
+                return _MISSING
+            self._podcast_cache.move_to_end(podcast_id)
+            return podcast
+
+    def _cache_podcast(self, podcast_id: str, status_code: int, data: dict) -> Union[Podcast, None]:
+        """
+        Construct a podcast from its JSON data and add it to the podcast cache
+
+        A podcast that was not found (a 404, or a successful response without one) is cached too,
+        for a shorter time. Other failed lookups are not cached.
+
+        :param podcast_id: ID of podcast
+        :type podcast_id: str
+        :param status_code: HTTP status of the lookup
+        :type status_code: int
+        :param data: Podcast JSON data
+        :type data: dict
+        :return: Podcast or None if not found
+        :rtype: Podcast
+        """
+        podcast = self._make_podcast(json_data=data) if data and data.get('podcast') else None
+        if podcast is None and status_code != 404 and not 200 <= status_code < 300:
+            # Rate limits and server errors say nothing about the podcast, so the next lookup tries again
+            return None
+        ttl = self.podcast_ttl if podcast is not None else self.podcast_miss_ttl
+        with self._podcast_cache_lock:
+            self._podcast_cache[podcast_id] = (time.monotonic() + ttl, podcast)
+            self._podcast_cache.move_to_end(podcast_id)
+            if len(self._podcast_cache) > _PODCAST_CACHE_SIZE:
+                self._podcast_cache.popitem(last=False)
+        return podcast
+
     def get_podcast_by_id(self, podcast_id: str) -> Union[Podcast, None]:
         """
         Get a podcast by its ID
 
+        Up to 1024 podcasts are cached for ``podcast_ttl`` seconds, so episodes from the same podcast share
+        one lookup. IDs that were not found are remembered for ``podcast_miss_ttl`` seconds.
+
         :param podcast_id: ID of podcast
         :type podcast_id: str
         :return: Podcast or None if not found
         :rtype: Podcast
         """
-        data = self._get_podcast_data_by_id(podcast_id=podcast_id)
-        if data and data.get('podcast'):
-            return self._make_podcast(json_data=data)
-        return None
+        podcast = self._cached_podcast(podcast_id=podcast_id)
+        if podcast is not _MISSING:
+            return podcast
+        res = self._get(url=_PODCAST_URL.format(podcast_id), stream=True)
+        return self._cache_podcast(podcast_id=podcast_id,
+                                   status_code=res.status_code,
+                                   data=self._read_json(res))
+
+    async def aget_podcast_by_id(self, podcast_id: str) -> Union[Podcast, None]:
+        """
+        Get a podcast by its ID, sharing the podcast cache with ``get_podcast_by_id``
+
+        :param podcast_id: ID of podcast
+        :type podcast_id: str
+        :return: Podcast or None if not found
+        :rtype: Podcast
+        """
+        podcast = self._cached_podcast(podcast_id=podcast_id)
+        if podcast is not _MISSING:
+            return podcast
+        res = await self._aget(url=_PODCAST_URL.format(podcast_id))
+        return self._cache_podcast(podcast_id=podcast_id,
+                                   status_code=res.status_code,
+                                   data=_json.loads(res.content) if res.is_success and res.content else {})
+
+    @staticmethod
+    def _unresolved_podcast_ids(episodes: List[Episode]) -> List[str]:
+        """
+        Get the distinct podcast IDs of episodes whose podcast has not been loaded yet
+
+        :param episodes: episodes to check
+        :type episodes: list[Episode]
+        :return: list of podcast IDs
+        :rtype: list[str]
+        """
+        return list({episode.podcast_id for episode in episodes
+                     if episode._podcast is None and episode.podcast_id})
+
+    @staticmethod
+    def _bind_podcasts(episodes: List[Episode], podcasts: Dict[str, Podcast]) -> List[Episode]:
+        """
+        Attach resolved podcasts to the episodes that are missing one
+
+        :param episodes: episodes to update
+        :type episodes: list[Episode]
+        :param podcasts: dictionary of podcast ID to podcast
+        :type podcasts: dict[str, Podcast]
+        :return: the same episodes
+        :rtype: list[Episode]
+        """
+        for episode in episodes:
+            if episode._podcast is None:
+                episode._podcast = podcasts.get(episode.podcast_id)
+        return episodes
+
+    def resolve_podcasts(self, episodes: List[Episode], concurrency: int = 16) -> List[Episode]:
+        """
+        Look up the podcasts of several episodes concurrently, one request per distinct podcast
+
+        :param episodes: episodes to resolve podcasts for
+        :type episodes: list[Episode]
+        :param concurrency: maximum number of concurrent requests (default: 16)
+        :type concurrency: int
+        :return: the same episodes, with their podcasts loaded
+        :rtype: list[Episode]
+        """
+        podcast_ids = self._unresolved_podcast_ids(episodes=episodes)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            podcasts = dict(zip(podcast_ids, executor.map(self.get_podcast_by_id, podcast_ids)))
+        return self._bind_podcasts(episodes=episodes, podcasts=podcasts)
+
+    async def aresolve_podcasts(self, episodes: List[Episode]) -> List[Episode]:
+        """
+        Look up the podcasts of several episodes concurrently, one request per distinct podcast
+
+        :param episodes: episodes to resolve podcasts for
+        :type episodes: list[Episode]
+        :return: the same episodes, with their podcasts loaded
+        :rtype: list[Episode]
+        """
+        podcast_ids = self._unresolved_podcast_ids(episodes=episodes)
+        podcasts = await asyncio.gather(*[self.aget_podcast_by_id(podcast_id=podcast_id)
+                                          for podcast_id in podcast_ids])
+        return self._bind_podcasts(episodes=episodes, podcasts=dict(zip(podcast_ids, podcasts)))
 
     def _get_episode_data_by_id(self, episode_id: str, podcast_id: str) -> dict:
         """
@@ -1574,31 +2490,35 @@ class PocketCast:
         :return: JSON data
         :rtype: dict
         """
-        endpoint = _get_endpoint("episode")
-        url = _make_url(base=self._api_base,
-                        endpoint=endpoint)
+        url = self._urls['episode']
         data = self._post_json(url=url,
                                data={'uuid': episode_id,
                                      'podcast': podcast_id}
                                )
         return data
 
-    def get_episode_by_id(self, episode_id: str, podcast_id: str) -> Union[Episode, None]:
+    def get_episode_by_id(self, episode_id: str, podcast_id: str, podcast: Podcast = None) -> Union[Episode, None]:
         """
         Get an episode by its ID
 
+        The episode's podcast is only fetched when ``Episode.podcast`` is first read, unless it is passed in.
+
         :param episode_id: ID of episode
         :type episode_id: str
         :param podcast_id: ID of podcast
         :type podcast_id: str
-        :return: JSON data
-        :rtype: dict
+        :param podcast: Podcast that the episode belongs to, if already loaded
+        :type podcast: Podcast
+        :return: Episode object or None if not found
+        :rtype: Episode
         """
         data = self._get_episode_data_by_id(episode_id=episode_id, podcast_id=podcast_id)
-        if data:
-            podcast = self.get_podcast_by_id(podcast_id=podcast_id)
-            return self._make_episode(json_data=data, podcast=podcast)
-        return None
+        if not data:
+            return None
+        episode = self._make_episode(json_data=data, podcast=podcast)
+        if episode.podcast_id is None:
+            episode.podcast_id = podcast_id
+        return episode
 
     def search(self, keyword: str) -> List[Podcast]:
         """
@@ -1609,9 +2529,7 @@ class PocketCast:
         :return: list of podcasts from search
         :rtype: list[Podcast]
         """
-        endpoint = _get_endpoint("search")
-        url = _make_url(base=self._api_base,
-                        endpoint=endpoint)
+        url = self._urls['search']
         data = self._post_json(url=url,
                                data={"term": keyword})
         return self._make_podcasts(json_data=data)
@@ -1619,13 +2537,20 @@ class PocketCast:
     @property
     def categories(self) -> List[Category]:
         """
-        Get the available PocketCasts categories
+        Get the available PocketCasts categories, fetched once per client
 
         :return: list of available categories
         :rtype: list[Category]
         """
-        data = self._get_json(url="https://static.pocketcasts.com/discover/json/categories_v2.json")
-        return self._make_categories(json_data=data)
+        if self._categories is None:
+            res = self._get(url=_CATEGORIES_URL, stream=True)
+            data = self._read_json(res)
+            if not res.ok:
+                # Not remembered, so the next read tries again
+                return []
+            self._categories = self._make_categories(json_data=data)
+            self._category_by_name = {category.name.casefold(): category for category in self._categories}
+        return self._categories
 
     def category(self, category_name: str) -> Union[Category, None]:
         """
@@ -1636,75 +2561,88 @@ class PocketCast:
         :return: Either a matching category or None if not found
         :rtype: Category
         """
-        for category in self.categories:
-            if category.name.lower() == category_name.lower():
-                return category
-        return None
+        if not self.categories:
+            return None
+        return self._category_by_name.get(category_name.casefold())
 
     @property
     def trending(self) -> List[Podcast]:
         """
-        Get trending podcasts
+        Get trending podcasts, revalidating the last fetch with a conditional GET
+
+        With ``cache_name`` set, the on-disk cache answers for up to an hour before the server is asked again.
 
         :return: list of trending podcasts
         :rtype: list[Podcast]
         """
-        endpoint = _get_endpoint("trending")
-        url = _make_url(base=self._lists_base,
-                        endpoint=endpoint,
-                        suffix=".json")
-        data = self._get_json(url=url)
-        return self._make_podcasts(json_data=data)
+        return list(self._get_list(url=self._list_urls['trending'], ttl=0))
 
     @property
     def popular(self) -> List[Podcast]:
         """
-        Get popular podcasts
+        Get popular podcasts, revalidating the last fetch with a conditional GET
+
+        With ``cache_name`` set, the on-disk cache answers for up to an hour before the server is asked again.
 
         :return: list of popular podcasts
         :rtype: list[Podcast]
         """
-        endpoint = _get_endpoint("popular")
-        url = _make_url(base=self._lists_base,
-                        endpoint=endpoint,
-                        suffix=".json")
-        data = self._get_json(url=url)
-        return self._make_podcasts(json_data=data)
+        return list(self._get_list(url=self._list_urls['popular'], ttl=0))
 
     @property
     def featured(self) -> List[Podcast]:
         """
-        Get featured podcasts
+        Get featured podcasts, reusing the last fetch for about ``featured_ttl`` seconds
 
         :return: list of featured podcasts
         :rtype: list[Podcast]
         """
-        endpoint = _get_endpoint("featured")
-        url = _make_url(base=self._lists_base,
-                        endpoint=endpoint,
-                        suffix=".json")
-        data = self._get_json(url=url)
-        return self._make_podcasts(json_data=data)
+        return list(self._get_list(url=self._list_urls['featured'], ttl=self.featured_ttl))
 
     @property
     def networks(self):
         """
         Get available podcast networks
 
-        :return: list of available podcast networks
-        :rtype: list
+        :return: available podcast networks (none are available yet)
+        :rtype: tuple
         """
-        return []
+        return ()
 
     def content(self, list_id: str) -> List[Podcast]:
         """
-        Get a list of podcasts by a list ID
+        Get a list of podcasts by a list ID, reusing the last fetch for about ``content_ttl`` seconds
 
         :param list_id: ID of list
         :type list_id: str
         :return: list of podcasts
         :rtype: list[Podcast]
         """
-        url = f"https://lists.pocketcasts.com/{list_id}.json"
-        data = self._get_json(url=url)
-        return self._make_podcasts(json_data=data)
+        return list(self.lazy_content(list_id=list_id))
+
+    def lazy_content(self, list_id: str) -> LazyPodcastList:
+        """
+        Get a list of podcasts by a list ID like ``content``, constructing each podcast only when it is first read
+
+        Named lists such as 'featured', 'trending' and 'popular' can be read this way too.
+
+        :param list_id: ID of list
+        :type list_id: str
+        :return: read-only sequence of podcasts
+        :rtype: LazyPodcastList
+        """
+        return self._get_list(url=_LIST_URL.format(list_id), ttl=self.content_ttl)
+
+    def contents(self, list_ids: List[str], max_workers: int = 8) -> Dict[str, List[Podcast]]:
+        """
+        Get several lists of podcasts concurrently
+
+        :param list_ids: IDs of lists
+        :type list_ids: list[str]
+        :param max_workers: maximum number of concurrent requests (default: 8)
+        :type max_workers: int
+        :return: dictionary of list ID to its podcasts
+        :rtype: dict[str, list[Podcast]]
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(list_ids, executor.map(self.content, list_ids)))
@@ -28,6 +28,12 @@ setuptools.setup(
         'library'
     ],  # Keywords that define your package best
     install_requires=requirements,
+    extras_require={
+        'speedups': ['orjson', 'ciso8601', 'brotli'],
+        'async': ['httpx[http2]'],
+        'cache': ['requests-cache>=1.0'],
+        'streaming': ['ijson>=3.1', 'requests-toolbelt']
+    },
     classifiers=[
         'License :: OSI Approved :: GNU General Public License v3 (GPLv3)',
         'Development Status :: 4 - Beta',
@@ -35,8 +41,6 @@ setuptools.setup(
         'Intended Audience :: Developers',  # Define that your audience are developers
         'Topic :: Software Development :: Build Tools',
         'Programming Language :: Python :: 3',  # Specify which python versions that you want to support
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
         'Topic :: Multimedia :: Video',
@@ -44,5 +48,5 @@ setuptools.setup(
         'Topic :: Internet :: WWW/HTTP',
         'Operating System :: OS Independent'
     ],
-    python_requires='>=3.6'
+    python_requires='>=3.8'
 )
\ No newline at end of file
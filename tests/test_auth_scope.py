@@ -0,0 +1,101 @@
+import asyncio
+import io
+import json
+import unittest
+
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+import pycketcasts.pocketcasts as pocketcasts
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class _LoginAdapter(HTTPAdapter):
+    """
+    Answer logins with the next token from a list, and record the Authorization header of every request
+    """
+
+    def __init__(self, tokens):
+        super().__init__()
+        self.tokens = list(tokens)
+        self.seen = []
+
+    def send(self, request, **kwargs):
+        self.seen.append((request.url, request.headers.get('Authorization')))
+        data = {'podcasts': []}
+        if request.url.endswith('/user/login'):
+            data = {'token': self.tokens.pop(0)} if self.tokens else {}
+        body = json.dumps(data).encode()
+        raw = HTTPResponse(body=io.BytesIO(body),
+                           headers={'Content-Type': 'application/json', 'Content-Length': str(len(body))},
+                           status=200,
+                           preload_content=False)
+        return self.build_response(request, raw)
+
+
+class AuthScopeTest(unittest.TestCase):
+    def setUp(self):
+        self.api = pocketcasts.PocketCast(email='user@example.com', password='password')
+        self.adapter = _LoginAdapter(tokens=['first', 'second'])
+        self.api._session.mount('https://', self.adapter)
+
+    def tearDown(self):
+        self.api.close()
+
+    def _authorization(self, url):
+        self.adapter.seen.clear()
+        self.api._get(url=url).close()
+        return self.adapter.seen[-1][1]
+
+    def test_token_sent_only_to_authenticated_endpoints(self):
+        self.api._ensure_token()
+        self.assertEqual(self._authorization(self.api._urls['files']), 'Bearer first')
+        self.assertEqual(self._authorization(pocketcasts._SHOW_NOTES_URL.format('episode')), 'Bearer first')
+        self.assertIsNone(self._authorization(pocketcasts._LIST_URL.format('featured')))
+        self.assertIsNone(self._authorization(pocketcasts._PODCAST_URL.format('podcast')))
+        self.assertIsNone(self._authorization(pocketcasts._CATEGORIES_URL))
+        self.assertIsNone(self._authorization('https://example.com/category.json'))
+        self.assertIsNone(self._authorization('https://api.pocketcasts.com.example.com/'))
+        self.assertNotIn('Authorization', self.api._session.headers)
+
+    def test_relogin_keeps_token_scoped(self):
+        self.api._login()
+        self.api._login()
+        self.assertEqual(self._authorization(self.api._urls['files']), 'Bearer second')
+        self.assertIsNone(self._authorization(pocketcasts._LIST_URL.format('featured')))
+        self.assertNotIn('Authorization', self.api._session.headers)
+
+    def test_login_without_token_raises(self):
+        self.adapter.tokens.clear()
+        with self.assertRaises(pocketcasts.AuthError):
+            self.api._ensure_token()
+
+    @unittest.skipIf(httpx is None, "requires httpx")
+    def test_async_token_sent_only_to_authenticated_endpoints(self):
+        seen = {}
+
+        def handler(request):
+            seen[str(request.url)] = request.headers.get('Authorization')
+            return httpx.Response(200, json={})
+
+        async def fetch():
+            self.api._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            self.api._async_semaphore = asyncio.Semaphore(1)
+            try:
+                await self.api._apost(url=self.api._urls['starred'])
+                await self.api._aget(url=pocketcasts._PODCAST_URL.format('podcast'))
+            finally:
+                await self.api._async_client.aclose()
+
+        asyncio.run(fetch())
+        self.assertEqual(seen[self.api._urls['starred']], 'Bearer first')
+        self.assertIsNone(seen[pocketcasts._PODCAST_URL.format('podcast')])
+        self.assertNotIn('Authorization', self.api._async_client.headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+import pycketcasts.pocketcasts as pocketcasts
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+
+class _GzipListAdapter(HTTPAdapter):
+    """
+    Answer every request with the same gzip-encoded list of podcasts, counting the requests that reach it
+    """
+
+    def __init__(self, podcast_ids):
+        super().__init__()
+        self.body = gzip.compress(json.dumps({'podcasts': [{'uuid': uuid} for uuid in podcast_ids]}).encode())
+        self.sent = 0
+
+    def send(self, request, **kwargs):
+        self.sent += 1
+        raw = HTTPResponse(body=io.BytesIO(self.body),
+                           headers={'Content-Type': 'application/json',
+                                    'Content-Encoding': 'gzip',
+                                    'Content-Length': str(len(self.body))},
+                           status=200,
+                           preload_content=False,
+                           decode_content=False)
+        return self.build_response(request, raw)
+
+
+@unittest.skipIf(requests_cache is None, "requires requests-cache")
+class CachedStreamingTest(unittest.TestCase):
+    podcast_ids = ['a0', 'a1', 'a2']
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.api = pocketcasts.PocketCast(email='user@example.com',
+                                          password='password',
+                                          cache_name=os.path.join(self._tmp.name, 'cache'))
+        self.adapter = _GzipListAdapter(podcast_ids=self.podcast_ids)
+        self.api._session.mount('https://', self.adapter)
+        self.url = pocketcasts._LIST_URL.format('cached-list')
+
+    def tearDown(self):
+        self.api.close()
+        self._tmp.cleanup()
+
+    def _stream_ids(self):
+        res = self.api._get(url=self.url, stream=True)
+        return [item['uuid'] for item in self.api._iter_json_items(res, key='podcasts')], res
+
+    def test_iter_json_items_reads_cached_response(self):
+        first, res = self._stream_ids()
+        self.assertFalse(res.from_cache)
+        second, res = self._stream_ids()
+        self.assertTrue(res.from_cache)
+        self.assertEqual(first, self.podcast_ids)
+        self.assertEqual(second, self.podcast_ids)
+        self.assertEqual(self.adapter.sent, 1)
+
+    def test_content_reads_cached_response(self):
+        self.assertEqual([podcast.id for podcast in self.api.content('cached-list')], self.podcast_ids)
+        self.api._list_cache.clear()
+        self.assertEqual([podcast.id for podcast in self.api.content('cached-list')], self.podcast_ids)
+        self.assertEqual(self.adapter.sent, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()